@@ -1,126 +1,134 @@
+import concurrent.futures
+import functools
+import math
+import textwrap
+from pathlib import Path
 import streamlit as st
 import numpy as np
 import sympy as sp
-from scipy.integrate import quad
+from scipy import LowLevelCallable
 import scipy.special as special
 from PIL import Image
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
-try:
-    icon = Image.open("assets/icon.png")
-except:
-    icon = "📐"
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+@st.cache_resource(show_spinner=False)
+def load_icon():
+    try:
+        icon = Image.open(ASSETS_DIR / "icon.png")
+        # Image.open is lazy; decode now so the cached image is ready to use
+        icon.load()
+        return icon
+    except Exception:
+        return "📐"
 
 st.set_page_config(
     page_title="Integration Calculator",
-    page_icon=icon,
+    page_icon=load_icon(),
     layout="centered",
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
-    <style>
-    body { overflow-x: hidden !important; }
-    
-    .stButton>button {
-        width: 100%;
-        background-color: #4CAF50;
-        color: white;
-        height: 3em;
-        font-weight: bold;
-        border-radius: 5px;
-    }
-
-    .stTextInput>div>div>input {
-        color: #4CAF50;
-        font-weight: bold;
-    }
-
-    h1, h2, h3 {
-        color: #1565C0;
-        text-align: center;
-    }
-
-    .highlight {
-        background-color: #e8f5e9;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-        border-left: 5px solid #4CAF50;
-        color: #2E7D32;
-        font-size: 1.1em;
-        font-weight: 500;
-    }
-
-    .result-box {
-        background-color: #263238;
-        color: #ECEFF1;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 5px solid #FF9800;
-        margin: 1rem 0;
-        font-size: 1.1em;
-        font-weight: bold;
-    }
-
-    .function-guide {
-        background-color: #1a1a1a;
-        color: #ffffff;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border-left: 5px solid #4CAF50;
-        margin: 1rem 0;
-    }
-
-    .angular-guide {
-        background-color: #e8eaf6;
-        padding: 1rem;
-        border-radius: 4px;
-        border-left: 4px solid #3f51b5;
-        margin: 0.5rem 0;
-        width: 100%;
-        box-sizing: border-box;
-    }
-
-    .angular-button {
-        width: 100%;
-        margin: 0.2rem 0;
-    }
-
-    .code-text {
-        font-family: monospace;
-        background-color: #333333;
-        padding: 0.2rem 0.4rem;
-        border-radius: 3px;
-        color: #4CAF50;
-    }
-    </style>
-""", unsafe_allow_html=True)
-def try_integration(expr, x):
+@st.cache_data(show_spinner=False)
+def load_styles():
     try:
-        result = sp.integrate(expr, x, meijerg=True, risch=True)
+        with open(ASSETS_DIR / "styles.css", encoding="utf-8") as css:
+            return f"<style>\n{css.read()}</style>\n"
+    except OSError:
+        return ""
+
+# Dedented, or Streamlit renders the indented lines as a code block
+WELCOME_HTML = textwrap.dedent("""
+    <div class='highlight'>
+    **Welcome to the Integration Calculator!** This tool computes **definite and indefinite** integrals easily.  
+    **Made by Uttaran** 🏆
+    </div>
+""")
+
+QUICK_EXAMPLES_HTML = textwrap.dedent("""
+    <div class='function-guide' style='padding: 1rem; margin-bottom: 0.5rem;'>
+    <h3 style='margin-bottom: 0.5rem; font-size: 1.1em;'>💡 Quick Examples:</h3>
+    <ul style='list-style-type: none; padding-left: 0; margin-bottom: 0;'>
+        <li style='margin-bottom: 5px; font-size: 0.8em;'>
+            📊Basic <span class='code-text'>x**2</span>
+        </li>
+        <li style='margin-bottom: 5px; font-size: 0.8em;'>
+            📐Trigonometric<span class='code-text'>sin(x)</span>
+        </li>
+        <li style='margin-bottom: 5px; font-size: 0.8em;'>
+            📈 Expotential <span class='code-text'>exp(-x)</span>
+        </li>
+        <li style='margin-bottom: 5px; font-size: 0.8em;'>
+            🔄Complex <span class='code-text'>sin(x**2)</span>
+        </li>
+    </ul>
+    </div>
+""")
+
+FUNCTION_GUIDE_HTML = textwrap.dedent("""
+    <div class='function-guide'>
+    <h3>🔢 Basic Operations</h3>
+    • Addition: <span class='code-text'>+</span> (x + 1)<br>
+    • Multiplication: <span class='code-text'>*</span> (2*x)<br>
+    • Power: <span class='code-text'>**</span> (x**2)<br>
+    • Division: <span class='code-text'>/</span> (x/2)<br>
+
+    <h3>🎯 Advanced Functions</h3>
+    • Trigonometric: <span class='code-text'>sin(x)</span>, <span class='code-text'>cos(x)</span>, <span class='code-text'>tan(x)</span><br>
+    • Inverse Trig: <span class='code-text'>asin(x)</span>, <span class='code-text'>acos(x)</span>, <span class='code-text'>atan(x)</span><br>
+    • Exponential: <span class='code-text'>exp(x)</span><br>
+    • Logarithmic: <span class='code-text'>log(x)</span>, <span class='code-text'>log10(x)</span><br>
+
+    <h3>🎲 Special Functions</h3>
+    • Fresnel Integrals: <span class='code-text'>sin(x**2)</span><br>
+    • Error Function: <span class='code-text'>exp(-x**2)</span><br>
+    • Inverse Functions: <span class='code-text'>1/sqrt(1-x**2)</span><br>
+
+    <h3>🎲 Constants</h3>
+    • π (pi): <span class='code-text'>pi</span><br>
+    • e: <span class='code-text'>e</span><br>
+    </div>
+""")
+SIN_X2 = 1
+EXP_NEG_X2 = 2
+
+def classify(expr, x):
+    # Compare expression trees, not printed text
+    if expr == sp.sin(x**2):
+        return SIN_X2
+    if expr == sp.exp(-x**2):
+        return EXP_NEG_X2
+    return 0
+
+def try_integration(expr, x, manual=False):
+    # Known closed forms go first, so sympy's integrators never run on them
+    flags = classify(expr, x)
+    if flags & SIN_X2:
+        return sp.sqrt(sp.pi/2) * sp.fresnels(sp.sqrt(2/sp.pi) * x)
+    if flags & EXP_NEG_X2:
+        return sp.sqrt(sp.pi) * sp.erf(x) / 2
+    # Skip Risch / Meijer-G where they can't help; sympy rejects two True flags
+    strategy = {}
+    if sp.count_ops(expr) > 3:
+        has_exp_log = expr.has(sp.exp, sp.log)
+        if not has_exp_log:
+            strategy['risch'] = False
+            if not expr.has(sp.functions.elementary.trigonometric.TrigonometricFunction):
+                strategy['meijerg'] = False
+    try:
+        result = sp.integrate(expr, x, **strategy)
         if result.has(sp.Integral):
-            expr_str = str(expr)
-            if 'sin(x**2)' in expr_str:
-                S, C = sp.fresnels(x), sp.fresnelc(x)
-                result = sp.sqrt(sp.pi/2) * (S + C)
-            elif 'exp(-x**2)' in expr_str:
-                result = sp.sqrt(sp.pi) * sp.erf(x) / 2
-            else:
-                simplified = sp.trigsimp(sp.apart(expr))
-                result = sp.integrate(simplified, x)
-                if result.has(sp.Integral):
-                    raise ValueError("Direct integration failed")
+            simplified = sp.trigsimp(sp.apart(expr))
+            result = sp.integrate(simplified, x)
+            if result.has(sp.Integral):
+                raise ValueError("Direct integration failed")
         return result
     except:
+        # manual integration is the slowest strategy, so it's opt-in
+        if not manual:
+            return None
         try:
-            if isinstance(expr, sp.Basic):
-                expr_str = str(expr)
-                if 'sin(x**2)' in expr_str:
-                    return sp.sqrt(sp.pi/2) * (sp.fresnels(x) + sp.fresnelc(x))
-                elif 'exp(-x**2)' in expr_str:
-                    return sp.sqrt(sp.pi) * sp.erf(x) / 2
             result = sp.integrate(expr, x, manual=True)
             if result.has(sp.Integral):
                 raise ValueError("Manual integration failed")
@@ -128,17 +136,254 @@ def try_integration(expr, x):
         except:
             return None
 
-def evaluate_special_function(expr_str, x_val):
+# Imported on first use to keep numba off the first page render
+def load_numba():
     try:
-        if 'sin(x**2)' in expr_str:
-            s, c = special.fresnel(x_val)
-            return np.sqrt(np.pi/2) * (s + c)
-        elif 'exp(-x**2)' in expr_str:
-            return np.sqrt(np.pi) * special.erf(x_val) / 2
+        import numba
+    except ImportError:
         return None
-    except:
+    return numba
+
+def fold_constants(expr):
+    # Evaluate constant subtrees once; rationals stay exact so 1/2 prints as sqrt
+    return expr.replace(lambda e: e.is_number and not e.is_Rational,
+                        lambda e: e.evalf(17))
+
+def compile_native(f_scalar, cache=False):
+    # Native scalar callback for quad, which samples one point at a time
+    numba = load_numba()
+    if numba is None:
+        return None
+    try:
+        c_func = numba.cfunc("float64(float64)", error_model='numpy', cache=cache)(f_scalar)
+        return LowLevelCallable(c_func.ctypes)
+    except Exception:
         return None
 
+def _square(x):
+    return x*x
+
+def _sin(x):
+    return math.sin(x)
+
+def _exp_neg(x):
+    return math.exp(-x)
+
+def _sin_square(x):
+    return math.sin(x*x)
+
+def _gaussian(x):
+    return math.exp(-x*x)
+
+# Kernels for common inputs, which numba can cache on disk
+_x = sp.Symbol('x')
+CANONICAL_FORMS = {
+    _x**2: _square,
+    sp.sin(_x): _sin,
+    sp.exp(-_x): _exp_neg,
+    sp.sin(_x**2): _sin_square,
+    sp.exp(-_x**2): _gaussian,
+}
+
+NUMPY_UFUNCS = {
+    sp.sin: np.sin,
+    sp.cos: np.cos,
+    sp.tan: np.tan,
+    sp.exp: np.exp,
+    sp.log: np.log,
+    sp.erf: special.erf,
+}
+
+# Built once rather than per lambdify call; scipy covers fresnels / fresnelc
+LAMBDIFY_MODULES = ('numpy', {
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'exp': np.exp,
+    'log': np.log,
+    'sqrt': np.sqrt,
+    'pi': np.pi,
+    'erf': special.erf
+}, 'scipy')
+
+def compile_expr(expr, x):
+    # Returns None outside plain arithmetic and NUMPY_UFUNCS, for lambdify to handle
+    if expr == x:
+        return lambda xs: xs
+    if expr.is_number:
+        try:
+            value = float(expr)
+        except TypeError:
+            # complex constants such as I
+            return None
+        return lambda xs: value
+    args = [compile_expr(arg, x) for arg in expr.args]
+    if None in args:
+        return None
+    if expr.is_Add or expr.is_Mul:
+        op = np.add if expr.is_Add else np.multiply
+        return lambda xs: functools.reduce(op, [g(xs) for g in args])
+    if expr.is_Pow:
+        base, exponent = args[0], expr.exp
+        if exponent == 2:
+            return lambda xs: np.square(base(xs))
+        if exponent == sp.Rational(1, 2):
+            return lambda xs: np.sqrt(base(xs))
+        if exponent.is_number:
+            n = float(exponent)
+            return lambda xs: np.power(base(xs), n)
+        return lambda xs: np.power(base(xs), args[1](xs))
+    ufunc = NUMPY_UFUNCS.get(expr.func)
+    if ufunc is None or len(args) != 1:
+        return None
+    return lambda xs: ufunc(args[0](xs))
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def compile_function(expr_str):
+    x = sp.symbols('x')
+    expr = sp.sympify(expr_str)
+    numeric = fold_constants(expr)
+    if numeric.is_polynomial(x):
+        # Horner form: one multiply-add per degree instead of a power per term
+        numeric = sp.horner(numeric, x)
+    f = compile_expr(numeric, x)
+    if f is None:
+        f = sp.lambdify(x, numeric, modules=LAMBDIFY_MODULES, cse=True)
+    return expr, numeric, f
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def native_integrand(expr_str):
+    # Only the adaptive quad path pays for JIT compilation
+    x = sp.symbols('x')
+    expr, numeric, f = compile_function(expr_str)
+    if expr in CANONICAL_FORMS:
+        integrand = compile_native(CANONICAL_FORMS[expr], cache=True)
+        if integrand is not None:
+            return integrand
+    # Float exponents, so x**-2 at 0 gives inf rather than a swallowed error
+    scalar = numeric.replace(lambda e: e.is_Pow and e.exp.is_Integer and e.exp.is_negative,
+                             lambda e: sp.Pow(e.base, sp.Float(e.exp)))
+    try:
+        f_scalar = sp.lambdify(x, scalar, 'math', cse=True)
+        # The math printer can emit names it lacks, such as log10
+        f_scalar(0.5)
+    except Exception:
+        return f
+    integrand = compile_native(f_scalar)
+    if integrand is None:
+        # Plain math calls on floats still beat numpy's scalar dispatch in quad
+        return f_scalar
+    return integrand
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def parse_limit(limit_str):
+    return float(sp.sympify(limit_str.replace('π', 'pi')).evalf())
+
+SYMBOLIC_TIMEOUT = 2.0
+
+@st.cache_resource(show_spinner=False)
+def symbolic_executor():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def symbolic_job(key, _expr, manual):
+    # One future per srepr key; it outlives a timeout and keeps the late result
+    return symbolic_executor().submit(try_integration, _expr, sp.symbols('x'), manual)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def integrate_symbolic(expr_str, manual=False):
+    expr = compile_function(expr_str)[0]
+    # The timeout propagates, so st.cache_data doesn't record it
+    result = symbolic_job(sp.srepr(expr), expr, manual).result(timeout=SYMBOLIC_TIMEOUT)
+    if result is None:
+        return None
+    return sp.latex(expr), sp.latex(result)
+
+@st.cache_resource(show_spinner=False)
+def gauss_legendre(n):
+    return np.polynomial.legendre.leggauss(n)
+
+@st.cache_resource(show_spinner=False)
+def unit_grid(n):
+    # Shared across reruns; callers must not write into it
+    return np.linspace(0.0, 1.0, n)
+
+def evaluate_on_grid(f, xs):
+    ys = f(xs)
+    if isinstance(ys, tuple):
+        ys = ys[0]
+    if np.iscomplexobj(ys):
+        raise TypeError("the function takes complex values")
+    # Constant expressions lambdify to a scalar
+    return np.broadcast_to(np.asarray(ys, dtype=np.float64), xs.shape)
+
+def gl_integrate(f, a, b):
+    # Gauss-Legendre; the 16/32-point difference is the error estimate
+    results = []
+    for n in (16, 32):
+        nodes, weights = gauss_legendre(n)
+        xs = 0.5*(b - a)*nodes + 0.5*(b + a)
+        results.append(0.5*(b - a)*np.dot(weights, evaluate_on_grid(f, xs)))
+    return results[1], abs(results[1] - results[0])
+
+def adaptive_sample(f, a, b, n0=200, tol=0.05, levels=2):
+    # Bisect intervals where the second differences show a sharp feature
+    x_vals = a + (b - a) * unit_grid(n0)
+    y_vals = evaluate_on_grid(f, x_vals)
+    for _ in range(levels):
+        if not np.isfinite(y_vals).all():
+            break
+        span = np.ptp(y_vals)
+        sharp = np.abs(np.diff(y_vals, 2)) > tol * span
+        if span == 0 or not sharp.any():
+            break
+        refine = np.zeros(len(x_vals) - 1, dtype=bool)
+        refine[:-1] |= sharp
+        refine[1:] |= sharp
+        where = np.flatnonzero(refine)
+        mids = 0.5 * (x_vals[where] + x_vals[where + 1])
+        x_vals = np.insert(x_vals, where + 1, mids)
+        y_vals = np.insert(y_vals, where + 1, evaluate_on_grid(f, mids))
+    return x_vals, y_vals
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def sample_function(expr_str, lower_limit, upper_limit):
+    f = compile_function(expr_str)[2]
+    plot_margin = (upper_limit - lower_limit) * 0.2
+    return adaptive_sample(f, lower_limit - plot_margin, upper_limit + plot_margin)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def definite_integral(expr_str, lower_limit, upper_limit, adaptive_quad):
+    from scipy.integrate import quad
+
+    expr, _, f = compile_function(expr_str)
+    # log and negative powers can blow up inside the interval
+    singular = expr.has(sp.log) or any(p.exp.is_negative for p in expr.atoms(sp.Pow))
+    integral_result, error_estimate = None, None
+    if not adaptive_quad and not singular:
+        integral_result, error_estimate = gl_integrate(f, lower_limit, upper_limit)
+    # Fall back to adaptive quad when the fixed rule hasn't converged
+    if integral_result is None or not np.isfinite(integral_result) or \
+            error_estimate > 1e-10 * max(1.0, abs(integral_result)):
+        integral_result, error_estimate, _, *message = quad(
+            native_integrand(expr_str), lower_limit, upper_limit, full_output=1)
+        if message:
+            raise ValueError(message[0])
+        if not np.isfinite(integral_result) or not np.isfinite(error_estimate):
+            raise ValueError("quad did not return a finite integral")
+    return integral_result, error_estimate
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def batch_integrate(expr_str, lower_limit, upper_limits):
+    # Map every [a, b_i] onto t in [0, 1] and integrate them together
+    from scipy.integrate import quad_vec
+
+    f = compile_function(expr_str)[2]
+    widths = np.asarray(upper_limits, dtype=np.float64) - lower_limit
+    results, error_estimate = quad_vec(
+        lambda t: evaluate_on_grid(f, lower_limit + widths*t) * widths, 0.0, 1.0)
+    return results, error_estimate
+
 def format_angle(value):
     if abs(value) < 1e-10:
         return "0"
@@ -156,21 +401,27 @@ def format_angle(value):
         return f"π/{den}" if num > 0 else f"-π/{den}"
     return f"{num}π/{den}"
 
-def create_plot(x_vals, y_vals, expr_str, lower_limit, upper_limit):
+def plot_dtype(values):
+    # float32 halves the chart payload while neighbouring samples stay distinct
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return np.float32
+    span, scale = np.ptp(finite), np.max(np.abs(finite))
+    if span == 0 or span / (len(values) * scale) > 100 * np.finfo(np.float32).eps:
+        return np.float32
+    return np.float64
+
+# The underscored arrays follow from the other arguments, so they aren't hashed
+@st.cache_resource(show_spinner=False, max_entries=32)
+def create_plot(_x_vals, _y_vals, _finite, expr_str, lower_limit, upper_limit):
     try:
-        y_vals = np.asarray(y_vals, dtype=np.float64)
-        
-        if 'sin(x**2)' in expr_str:
-            s, c = special.fresnel(x_vals)
-            y_vals = np.sqrt(np.pi/2) * s
+        x_vals = np.asarray(_x_vals, dtype=plot_dtype(_x_vals))
+        y_vals = np.asarray(_y_vals, dtype=plot_dtype(_y_vals))
         
-        fig = make_subplots()
+        fig = go.Figure()
         
-        mask = np.isfinite(y_vals)
-        fig.add_trace(go.Scatter(
-            x=x_vals[mask],
-            y=y_vals[mask],
-            name="f(x)",
+        curve_style = dict(
+            legendgroup="f(x)",
             line=dict(color='#2962FF', width=1.5),
             mode='lines',
             hovertemplate="<b>x</b>: %{x:.4f}<br><b>f(x)</b>: %{y:.4f}",
@@ -178,19 +429,32 @@ def create_plot(x_vals, y_vals, expr_str, lower_limit, upper_limit):
                 bgcolor="#1565C0",
                 font=dict(size=12, color='white')
             )
-        ))
-        
-        fill_mask = (x_vals >= lower_limit) & (x_vals <= upper_limit) & np.isfinite(y_vals)
-        if np.any(fill_mask):
-            fig.add_trace(go.Scatter(
-                x=x_vals[fill_mask],
-                y=y_vals[fill_mask],
+        )
+
+        x_vals, y_vals = x_vals[_finite], y_vals[_finite]
+        # x_vals is sorted, so the integration range is a contiguous slice
+        eps = 1e-6 * (x_vals[-1] - x_vals[0])
+        lo = np.searchsorted(x_vals, lower_limit - eps, side='left')
+        hi = np.searchsorted(x_vals, upper_limit + eps, side='right')
+        if hi > lo:
+            gap = [np.nan]
+            # WebGL traces draw the curve on the GPU instead of as SVG paths
+            fig.add_trace(go.Scattergl(
+                x=np.concatenate((x_vals[:lo + 1], gap, x_vals[hi - 1:])).astype(x_vals.dtype),
+                y=np.concatenate((y_vals[:lo + 1], gap, y_vals[hi - 1:])).astype(y_vals.dtype),
+                name="f(x)",
+                **curve_style
+            ))
+            fig.add_trace(go.Scattergl(
+                x=x_vals[lo:hi],
+                y=y_vals[lo:hi],
                 fill='tozeroy',
                 name="Integration Area",
-                line=dict(color='#00C853'),
                 fillcolor='rgba(0, 200, 83, 0.2)',
-                hoverinfo='skip'
+                **curve_style
             ))
+        else:
+            fig.add_trace(go.Scattergl(x=x_vals, y=y_vals, name="f(x)", **curve_style))
 
         fig.add_vline(
             x=lower_limit,
@@ -262,8 +526,6 @@ def create_plot(x_vals, y_vals, expr_str, lower_limit, upper_limit):
             )
         )
 
-        fig.update_traces(marker=dict(size=12), selector=dict(mode='markers+text'))
-        
         return fig
     except Exception as e:
         st.error(f"Error creating plot: The function might be undefined in some regions")
@@ -272,12 +534,8 @@ def create_plot(x_vals, y_vals, expr_str, lower_limit, upper_limit):
 def main():
     st.title(' Advanced Integration Calculator')
     
-    st.markdown("""
-    <div class='highlight'>
-    **Welcome to the Integration Calculator!** This tool computes **definite and indefinite** integrals easily.  
-    **Made by Uttaran** 🏆
-    </div>
-    """, unsafe_allow_html=True)
+    # One element for the page styles and the banner instead of two
+    st.markdown(load_styles() + WELCOME_HTML, unsafe_allow_html=True)
 
     # Create two columns for input and guide
     input_col, guide_col = st.columns([2, 1])
@@ -301,8 +559,7 @@ def main():
                 lower_limit_str = st.text_input('Lower Limit:', value="0", 
                     help="Enter as multiples of π (e.g., pi/2, -pi, 2*pi) or regular numbers")
                 try:
-                    expr = lower_limit_str.replace('π', 'pi')
-                    lower_limit = float(sp.sympify(expr).evalf())
+                    lower_limit = parse_limit(lower_limit_str)
                 except:
                     st.error("Invalid input. Examples: pi/2, -pi, 1, 0.5")
                     lower_limit = 0.0
@@ -314,12 +571,38 @@ def main():
                 upper_limit_str = st.text_input('Upper Limit:', value="pi/2", 
                     help="Enter as multiples of π (e.g., pi/2, -pi, 2*pi) or regular numbers")
                 try:
-                    expr = upper_limit_str.replace('π', 'pi')
-                    upper_limit = float(sp.sympify(expr).evalf())
+                    upper_limit = parse_limit(upper_limit_str)
                 except:
                     st.error("Invalid input. Examples: pi/2, -pi, 1, 0.5")
                     upper_limit = np.pi/2
 
+        adaptive_quad = st.checkbox(
+            "Always use adaptive quadrature",
+            value=False,
+            help="Skip the fast Gauss-Legendre rule and integrate with scipy's adaptive quad"
+        )
+
+        do_symbolic = st.checkbox(
+            "Symbolic antiderivative",
+            value=False,
+            help="Also look for an indefinite integral with SymPy; this can take a few seconds"
+        )
+        manual_integration = do_symbolic and st.checkbox(
+            "Try manual integration",
+            value=False,
+            help="Let SymPy fall back to its step-by-step integrator; slow, but finds some extra antiderivatives"
+        )
+
+        batch_limits = ()
+        if st.checkbox("Batch mode", value=False,
+                       help="Also integrate from the lower limit to each of several upper limits"):
+            batch_str = st.text_input('Additional Upper Limits:', value="",
+                help="Comma-separated, e.g. 1, 2, pi")
+            try:
+                batch_limits = tuple(parse_limit(item) for item in batch_str.split(',') if item.strip())
+            except:
+                st.error("Invalid input. Examples: 1, 2.5, pi/2")
+
         # Add quick angular value buttons
         if limit_type == "Angular (π)":
             st.markdown("<div class='angular-guide'>Common Angular Values:</div>", unsafe_allow_html=True)
@@ -331,51 +614,10 @@ def main():
                     if st.button(label, key=key, use_container_width=True):
                         upper_limit = np.pi/(6 if key == "pi6" else 4 if key == "pi4" else 3 if key == "pi3" else 2)
     with guide_col:
-        st.markdown("""
-        <div class='function-guide' style='padding: 1rem; margin-bottom: 0.5rem;'>
-        <h3 style='margin-bottom: 0.5rem; font-size: 1.1em;'>💡 Quick Examples:</h3>
-        <ul style='list-style-type: none; padding-left: 0; margin-bottom: 0;'>
-            <li style='margin-bottom: 5px; font-size: 0.8em;'>
-                📊Basic <span class='code-text'>x**2</span>
-            </li>
-            <li style='margin-bottom: 5px; font-size: 0.8em;'>
-                📐Trigonometric<span class='code-text'>sin(x)</span>
-            </li>
-            <li style='margin-bottom: 5px; font-size: 0.8em;'>
-                📈 Expotential <span class='code-text'>exp(-x)</span>
-            </li>
-            <li style='margin-bottom: 5px; font-size: 0.8em;'>
-                🔄Complex <span class='code-text'>sin(x**2)</span>
-            </li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(QUICK_EXAMPLES_HTML, unsafe_allow_html=True)
 
         with st.expander("📚 Function Guide", expanded=False):
-            st.markdown("""
-            <div class='function-guide'>
-            <h3>🔢 Basic Operations</h3>
-            • Addition: <span class='code-text'>+</span> (x + 1)<br>
-            • Multiplication: <span class='code-text'>*</span> (2*x)<br>
-            • Power: <span class='code-text'>**</span> (x**2)<br>
-            • Division: <span class='code-text'>/</span> (x/2)<br>
-
-            <h3>🎯 Advanced Functions</h3>
-            • Trigonometric: <span class='code-text'>sin(x)</span>, <span class='code-text'>cos(x)</span>, <span class='code-text'>tan(x)</span><br>
-            • Inverse Trig: <span class='code-text'>asin(x)</span>, <span class='code-text'>acos(x)</span>, <span class='code-text'>atan(x)</span><br>
-            • Exponential: <span class='code-text'>exp(x)</span><br>
-            • Logarithmic: <span class='code-text'>log(x)</span>, <span class='code-text'>log10(x)</span><br>
-            
-            <h3>🎲 Special Functions</h3>
-            • Fresnel Integrals: <span class='code-text'>sin(x**2)</span><br>
-            • Error Function: <span class='code-text'>exp(-x**2)</span><br>
-            • Inverse Functions: <span class='code-text'>1/sqrt(1-x**2)</span><br>
-            
-            <h3>🎲 Constants</h3>
-            • π (pi): <span class='code-text'>pi</span><br>
-            • e: <span class='code-text'>e</span><br>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FUNCTION_GUIDE_HTML, unsafe_allow_html=True)
 
     # Calculate button and results moved outside columns for full width
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -388,33 +630,15 @@ def main():
                 st.error("⚠️ Upper limit must be greater than lower limit")
                 return
 
-            x = sp.symbols('x')
-            expr = sp.sympify(expr_str)
-            
-            f = sp.lambdify(x, expr, modules=['numpy', {
-                'sin': np.sin, 
-                'cos': np.cos,
-                'tan': np.tan,
-                'exp': np.exp,
-                'log': np.log,
-                'sqrt': np.sqrt,
-                'pi': np.pi,
-                'erf': special.erf,
-                'fresnels': special.fresnel,
-                'fresnelc': special.fresnel
-            }])
-
-            plot_margin = (upper_limit - lower_limit) * 0.2
-            x_vals = np.linspace(lower_limit - plot_margin, upper_limit + plot_margin, 1000)
-            
+            # Surface syntax errors before any sampling happens
+            compile_function(expr_str)
+
             try:
-                y_vals = f(x_vals)
-                if isinstance(y_vals, tuple):
-                    y_vals = y_vals[0]
-                
-                y_vals = np.asarray(y_vals, dtype=np.float64)
+                x_vals, y_vals = sample_function(expr_str, lower_limit, upper_limit)
                 
-                if np.any(~np.isfinite(y_vals)):
+                # One finiteness pass, shared with the plot
+                finite = np.isfinite(y_vals)
+                if not finite.all():
                     st.error("⚠️ Function produces infinite or undefined values")
                     return
                     
@@ -422,22 +646,28 @@ def main():
                 st.error("⚠️ Error calculating function values. Please check your function syntax.")
                 return
 
-            indefinite_result = try_integration(expr, x)
-            
-            if indefinite_result is not None:
-                latex_integral = sp.latex(indefinite_result)
-                st.markdown(f"""
-                ### Indefinite Integral:
-                $$ \int {sp.latex(expr)} \,dx = {latex_integral} + C $$
-                """)
-            else:
-                st.warning("⚠️ Couldn't find a symbolic indefinite integral. "
-                          "The function might be too complex for analytical integration.")
-            
+            if do_symbolic:
+                try:
+                    indefinite_latex = integrate_symbolic(expr_str, manual_integration)
+                except concurrent.futures.TimeoutError:
+                    st.warning("⚠️ Symbolic integration timed out. Try again, or untick "
+                              "\"Symbolic antiderivative\" for just the definite value.")
+                else:
+                    if indefinite_latex is not None:
+                        latex_expr, latex_integral = indefinite_latex
+                        st.markdown(f"""
+                        ### Indefinite Integral:
+                        $$ \int {latex_expr} \,dx = {latex_integral} + C $$
+                        """)
+                    else:
+                        st.warning("⚠️ Couldn't find a symbolic indefinite integral. "
+                                  "The function might be too complex for analytical integration.")
+
             try:
-                integral_result, error_estimate = quad(f, lower_limit, upper_limit)
+                integral_result, error_estimate = definite_integral(
+                    expr_str, lower_limit, upper_limit, adaptive_quad)
                 
-                fig = create_plot(x_vals, y_vals, expr_str, lower_limit, upper_limit)
+                fig = create_plot(x_vals, y_vals, finite, expr_str, lower_limit, upper_limit)
                 if fig is not None:
                     st.plotly_chart(fig, use_container_width=True)
 
@@ -458,6 +688,21 @@ def main():
 
                 if abs(error_estimate) > 1e-6:
                     st.warning("⚠️ Note: The error estimate is relatively large.")
+
+                if batch_limits:
+                    batch_results, batch_error = batch_integrate(expr_str, lower_limit, batch_limits)
+                    batch_rows = "\n".join(
+                        f"                - 📍 [{limit_display_lower}, "
+                        f"{format_angle(b) if limit_type == 'Angular (π)' else f'{b:.4f}'}]: `{r:.6f}`"
+                        for b, r in zip(batch_limits, batch_results))
+                    st.markdown(f"""
+                <div class='result-box'>
+                Batch Results:
+
+{batch_rows}
+                - 😭 Error Estimate: `{batch_error:.2e}`
+                </div>
+                """, unsafe_allow_html=True)
                     
             except Exception as int_error:
                 st.error("⚠️ Error computing the definite integral. The function might be too complex or undefined in the given interval.")